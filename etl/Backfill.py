@@ -0,0 +1,110 @@
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict
+
+from Extract import Extract
+from transform.AirQualityTransformer import AirQualityTransformer
+
+class Backfill:
+    def __init__(self, logger: logging.Logger, extractor: Extract,
+                 transformer: AirQualityTransformer, checkpoint_dir: str, workers: int):
+        self.extractor = extractor
+        self.transformer = transformer
+        self.checkpoint_dir = checkpoint_dir
+        self.workers = workers
+        self.logger = logger
+
+    def get_chunks(self, data_coordinates: Dict, start: int, end: int,
+                   chunk_seconds: int) -> list:
+        chunks = []
+        for latitude in data_coordinates["latitude"]:
+            for longitude in data_coordinates["longitude"]:
+                chunk_start = start
+                while chunk_start < end:
+                    # The history endpoint includes both bounds, so chunks must not share one
+                    chunk_end = min(chunk_start + chunk_seconds, end) - 1
+                    chunks.append({
+                        "latitude": latitude,
+                        "longitude": longitude,
+                        "start": chunk_start,
+                        "end": chunk_end
+                    })
+                    chunk_start = chunk_end + 1
+        return chunks
+
+    def get_checkpoint_path(self, chunk: Dict) -> str:
+        file_name = (f"air_quality_{chunk['latitude']}_{chunk['longitude']}"
+                     f"_{chunk['start']}_{chunk['end']}.json")
+        return os.path.join(self.checkpoint_dir, file_name)
+
+    def save_checkpoint(self, chunk: Dict, records: list) -> None:
+        path = self.get_checkpoint_path(chunk)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(records, file)
+        # Atomic rename, an interrupted run never leaves a half written checkpoint
+        os.replace(tmp_path, path)
+
+    def read_checkpoint(self, chunk: Dict) -> list:
+        with open(self.get_checkpoint_path(chunk), encoding="utf-8") as file:
+            return json.load(file)
+
+    def clear_checkpoints(self, chunks: list) -> None:
+        for chunk in chunks:
+            path = self.get_checkpoint_path(chunk)
+            if os.path.isfile(path):
+                os.remove(path)
+
+    def process_chunk(self, chunk: Dict) -> int:
+        response = self.extractor.get_history(chunk["latitude"], chunk["longitude"],
+                                              chunk["start"], chunk["end"])
+        if response["status"] == "failed":
+            return -1
+
+        record = {
+            "latitude": chunk["latitude"],
+            "longitude": chunk["longitude"],
+            "timestamp": chunk["start"],
+            "data": {"OPEN_WEATHER_AIR_QUALITY": response["data"]}
+        }
+        transformed_records = self.transformer.transform_history(record)
+        self.save_checkpoint(chunk, transformed_records)
+        return len(transformed_records)
+
+    def fetch(self, chunks: list) -> int:
+        if not os.path.exists(self.checkpoint_dir):
+            os.makedirs(self.checkpoint_dir)
+
+        pending = [chunk for chunk in chunks
+                   if not os.path.isfile(self.get_checkpoint_path(chunk))]
+        self.logger.info(f"Backfill chunks: {len(chunks)} total, "
+                         f"{len(chunks) - len(pending)} already checkpointed")
+
+        successful = 0
+        failed = 0
+        with ThreadPoolExecutor(max_workers=self.workers,
+                                thread_name_prefix="backfill") as executor:
+            futures = {executor.submit(self.process_chunk, chunk): chunk for chunk in pending}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.logger.error(f"Backfill chunk failed {chunk}: {e}")
+                    result = -1
+                if result == -1:
+                    failed += 1
+                    continue
+                successful += 1
+
+        self.logger.info(f"Backfill extraction completed: {successful} success, {failed} failed")
+        return failed
+
+    def collect(self, chunks: list) -> list:
+        records = []
+        for chunk in chunks:
+            records.extend(self.read_checkpoint(chunk))
+        records.sort(key=lambda record: (record["recorded_at"], record["zone_id"]))
+        return records
@@ -1,16 +1,23 @@
 import requests
 import logging
+import threading
+import time
 from typing import Dict
 
 class Extract:
     def __init__(self, logger: logging.Logger, api_name:str, api_key:str, constant_params:str, 
-                 search_params:str, api_base_url:str,):
+                 search_params:str, api_base_url:str, api_history_url:str = None,  # type: ignore
+                 requests_per_minute:int = 0):
         self.api_name = api_name
         self.api_key = api_key
         self.api_constant_params = constant_params
         self.api_search_params = search_params
         self.api_base_url = api_base_url
+        self.api_history_url = api_history_url
         self.logger = logger
+        self.min_interval = 60 / requests_per_minute if requests_per_minute > 0 else 0
+        self.next_request_at = 0.0
+        self.rate_lock = threading.Lock()
 
     def validate_coordinates(self, latitude: float, longitude: float) -> bool:
         if not isinstance(latitude, (float, int)) or not isinstance(longitude, (float, int)):
@@ -25,13 +32,22 @@ class Extract:
 
         return True
 
-    def get_data(self, latitude: float, longitude: float)->Dict:
-        if not self.validate_coordinates(latitude, longitude):
-            return {"status": "failed"}
-        
-        url = self.api_base_url 
-        url += self.api_search_params.format(latitude = latitude, longitude = longitude)
-        url += self.api_constant_params + self.api_key
+    def wait_rate_limit(self) -> None:
+        if self.min_interval == 0:
+            return
+
+        # Reserve the next slot under the lock, sleep outside of it so other threads
+        # can reserve theirs.
+        with self.rate_lock:
+            now = time.monotonic()
+            wait = self.next_request_at - now
+            self.next_request_at = max(now, self.next_request_at) + self.min_interval
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def request(self, url: str) -> Dict:
+        self.wait_rate_limit()
         try:
             response = requests.get(url, timeout=10)
             response.raise_for_status()
@@ -44,4 +60,29 @@ class Extract:
                 f"****{self.api_key[-4:]}",
                 f"{e}".replace(self.api_key, f"****{self.api_key[-4:]}")
             )
-            return {"status": "failed"}
\ No newline at end of file
+            return {"status": "failed"}
+
+    def get_data(self, latitude: float, longitude: float)->Dict:
+        if not self.validate_coordinates(latitude, longitude):
+            return {"status": "failed"}
+        
+        url = self.api_base_url 
+        url += self.api_search_params.format(latitude = latitude, longitude = longitude)
+        url += self.api_constant_params + self.api_key
+        return self.request(url)
+
+    def get_history(self, latitude: float, longitude: float, start: int, end: int)->Dict:
+        if self.api_history_url is None:
+            self.logger.error("API (%s) does not provide historical data", self.api_name)
+            return {"status": "failed"}
+        if not self.validate_coordinates(latitude, longitude):
+            return {"status": "failed"}
+        if start > end:
+            self.logger.error("Invalid history range: start=%d, end=%d", start, end)
+            return {"status": "failed"}
+
+        url = self.api_history_url
+        url += self.api_search_params.format(latitude = latitude, longitude = longitude)
+        url += f"&start={start}&end={end}"
+        url += self.api_constant_params + self.api_key
+        return self.request(url)
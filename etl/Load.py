@@ -6,14 +6,18 @@ class Load:
         self.engine = engine
         self.logger = logger
 
-    def load_data(self, data: dict, table: str) -> tuple[int, int]:
+    def load_data(self, data: dict, table: str, chunksize: int = None) -> tuple[int, int]: # type: ignore
         successful = 0
         failed = 0
 
         try:
             df = pd.DataFrame(data)
             df['recorded_at'] = pd.to_datetime(df['recorded_at'], unit='s', utc=True)
-            df.to_sql(table, self.engine, if_exists='append', index=False)
+            if chunksize is None:
+                df.to_sql(table, self.engine, if_exists='append', index=False)
+            else:
+                df.to_sql(table, self.engine, if_exists='append', index=False, 
+                          method='multi', chunksize=chunksize)
             successful = len(df)
         except Exception as e:
             self.logger.critical(f"Failed to load data into {table}: {e}")
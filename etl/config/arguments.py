@@ -1,5 +1,18 @@
 import argparse
 import logging
+from datetime import datetime, timezone
+
+# First timestamp served by the OpenWeather air pollution history endpoint (2020-11-27 UTC)
+AIR_QUALITY_HISTORY_START = 1606435200
+
+def parse_timestamp(value: str) -> int:
+    try:
+        date = datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date '{value}', expected ISO 8601 format")
+    if date.tzinfo is None:
+        date = date.replace(tzinfo = timezone.utc)
+    return int(date.timestamp())
 
 def get_args(logger: logging.Logger) -> argparse.Namespace:
     parser = argparse.ArgumentParser()
@@ -10,6 +23,14 @@ def get_args(logger: logging.Logger) -> argparse.Namespace:
     parser.add_argument("--grid_size", type = float, default = 0.02, required = True)
     parser.add_argument("--target_table", type = str, choices = ["weather", "air_quality"]
                         , default = "weather", required = True)
+    parser.add_argument("--backfill", type = parse_timestamp, nargs = 2, 
+                        metavar = ("START", "END"), default = None, required = False)
+    parser.add_argument("--chunk_days", type = int, default = 7, required = False)
+    parser.add_argument("--workers", type = int, default = 4, required = False)
+    parser.add_argument("--requests_per_minute", type = int, default = 60, required = False)
+    parser.add_argument("--checkpoint_dir", type = str, default = "checkpoints", 
+                        required = False)
+    parser.add_argument("--api_host", type = str, default = None, required = False)
 
     # Validate arguments
     args = parser.parse_args()
@@ -36,5 +57,29 @@ def get_args(logger: logging.Logger) -> argparse.Namespace:
         logger.critical("Longitude values must be between -180 and 180")
         return None # type: ignore
 
+    if args.backfill is not None:
+        start, end = args.backfill
+        if args.target_table != "air_quality":
+            logger.critical("backfill is only supported for the air_quality table")
+            return None # type: ignore
+        if start >= end:
+            logger.critical("backfill START must be before END")
+            return None # type: ignore
+        if start < AIR_QUALITY_HISTORY_START:
+            logger.critical("backfill START must be after 2020-11-27")
+            return None # type: ignore
+        if end > datetime.now(timezone.utc).timestamp():
+            logger.critical("backfill END must not be in the future")
+            return None # type: ignore
+        if args.chunk_days <= 0:
+            logger.critical("chunk_days must be a positive number")
+            return None # type: ignore
+        if args.workers <= 0:
+            logger.critical("workers must be a positive number")
+            return None # type: ignore
+        if args.requests_per_minute <= 0:
+            logger.critical("requests_per_minute must be a positive number")
+            return None # type: ignore
+
     logger.info(f"Arguments parsed successfully")
     return args
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""
+Local mock of the OpenWeather air pollution API serving synthetic data, used to verify the
+pipeline and the backfill mode without an API key or network access.
+
+Usage:
+    python mock/air_pollution_server.py --port 8000
+    python pipeline.py ... --target_table air_quality --api_host http://localhost:8000 \\
+        --backfill 2024-01-01 2024-02-01
+"""
+
+import argparse
+import json
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+from urllib.parse import parse_qs, urlsplit
+
+HOUR = 60 * 60
+
+def get_components(latitude: float, longitude: float, timestamp: int) -> Dict:
+    # Deterministic values so two runs over the same range produce the same rows
+    phase = math.sin(timestamp / HOUR / 24 * 2 * math.pi + latitude + longitude)
+    return {
+        "co": round(300 + 100 * phase, 2),
+        "no": round(max(0.0, 5 * phase), 2),
+        "no2": round(20 + 10 * phase, 2),
+        "o3": round(60 - 30 * phase, 2),
+        "so2": round(8 + 4 * phase, 2),
+        "pm2_5": round(15 + 10 * phase, 2),
+        "pm10": round(25 + 15 * phase, 2),
+        "nh3": round(3 + 2 * phase, 2),
+    }
+
+def get_entry(latitude: float, longitude: float, timestamp: int) -> Dict:
+    return {
+        "main": {"aqi": 2},
+        "components": get_components(latitude, longitude, timestamp),
+        "dt": timestamp
+    }
+
+class AirPollutionHandler(BaseHTTPRequestHandler):
+    max_requests_per_minute = 0
+    request_times = []
+    request_lock = threading.Lock()
+
+    def is_rate_limited(self) -> bool:
+        if self.max_requests_per_minute <= 0:
+            return False
+        with self.request_lock:
+            now = time.monotonic()
+            self.request_times[:] = [t for t in self.request_times if now - t < 60]
+            if len(self.request_times) >= self.max_requests_per_minute:
+                return True
+            self.request_times.append(now)
+        return False
+
+    def send_json(self, status: int, body: Dict) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        if "appid" not in params:
+            self.send_json(401, {"cod": 401, "message": "Invalid API key."})
+            return
+        if self.is_rate_limited():
+            self.send_json(429, {"cod": 429, "message": "Too many requests."})
+            return
+
+        try:
+            latitude = float(params["lat"])
+            longitude = float(params["lon"])
+            coord = {"lon": longitude, "lat": latitude}
+
+            if url.path == "/data/2.5/air_pollution":
+                now = int(datetime.now(timezone.utc).timestamp())
+                entries = [get_entry(latitude, longitude, now - now % HOUR)]
+            elif url.path == "/data/2.5/air_pollution/history":
+                start = int(params["start"])
+                end = int(params["end"])
+                first = start + (-start % HOUR)
+                entries = [get_entry(latitude, longitude, timestamp)
+                           for timestamp in range(first, end + 1, HOUR)]
+            else:
+                self.send_json(404, {"cod": "404", "message": "Internal error"})
+                return
+        except (KeyError, ValueError):
+            self.send_json(400, {"cod": "400", "message": "Invalid parameters"})
+            return
+
+        self.send_json(200, {"coord": coord, "list": entries})
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", type = str, default = "localhost")
+    parser.add_argument("--port", type = int, default = 8000)
+    parser.add_argument("--max_requests_per_minute", type = int, default = 0)
+    args = parser.parse_args()
+
+    AirPollutionHandler.max_requests_per_minute = args.max_requests_per_minute
+    server = ThreadingHTTPServer((args.host, args.port), AirPollutionHandler)
+    print(f"Serving mock air pollution API on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    server.server_close()
+
+if __name__ == "__main__":
+    main()
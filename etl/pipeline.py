@@ -6,8 +6,10 @@ from datetime import datetime, timezone
 from sqlalchemy import create_engine, text
 import pandas as pd
 from typing import Dict
+from urllib.parse import urlsplit
 
 from Extract import Extract
+from Backfill import Backfill
 from transform.AirQualityTransformer import AirQualityTransformer
 from transform.WeatherTransformer import WeatherTransformer
 from Load import Load
@@ -71,21 +73,28 @@ def get_zone_id(data_coordinates: Dict, engine) -> pd.DataFrame:
         return None # type: ignore
     return zone_ids
 
-def get_extractors(required_apis: Dict) -> Dict:
+def replace_api_host(url: str, api_host: str) -> str:
+    parts = urlsplit(url)
+    return api_host.rstrip("/") + url[len(f"{parts.scheme}://{parts.netloc}"):]
+
+def get_extractors(required_apis: Dict, requests_per_minute: int = 0,
+                   api_host: str = None) -> Dict: # type: ignore
     api_data = {
         "OPEN_WEATHER_WEATHER": {
             "api_name": "Open Weather Weather",
             "api_key": f'&appid={{api_key}}',
             "constant_params": "&units=metric&lang=es",
             "search_params": "lat={latitude}&lon={longitude}",
-            "api_base_url": "https://api.openweathermap.org/data/2.5/weather?"
+            "api_base_url": "https://api.openweathermap.org/data/2.5/weather?",
+            "api_history_url": None
         },
         "OPEN_WEATHER_AIR_QUALITY": {
             "api_name": "Open Weather Air Quality",
             "api_key": f'&appid={{api_key}}',
             "constant_params": "&lang=es",
             "search_params": "lat={latitude}&lon={longitude}",
-            "api_base_url": "http://api.openweathermap.org/data/2.5/air_pollution?"
+            "api_base_url": "http://api.openweathermap.org/data/2.5/air_pollution?",
+            "api_history_url": "http://api.openweathermap.org/data/2.5/air_pollution/history?"
         }
     }
     
@@ -94,13 +103,21 @@ def get_extractors(required_apis: Dict) -> Dict:
         if api_name not in api_data:
             logger.critical(f"API '{api_name}' is not supported.")
             return {}
+        api_base_url = api_data[api_name]["api_base_url"]
+        api_history_url = api_data[api_name]["api_history_url"]
+        if api_host is not None:
+            api_base_url = replace_api_host(api_base_url, api_host)
+            if api_history_url is not None:
+                api_history_url = replace_api_host(api_history_url, api_host)
         extractors[api_name] = Extract(
             logger = logger,
             api_name = api_data[api_name]["api_name"],
             api_key = api_data[api_name]["api_key"].format(api_key = api_key),
             constant_params = api_data[api_name]["constant_params"],
             search_params = api_data[api_name]["search_params"],
-            api_base_url = api_data[api_name]["api_base_url"]
+            api_base_url = api_base_url,
+            api_history_url = api_history_url,
+            requests_per_minute = requests_per_minute
         )
 
     return extractors
@@ -225,6 +242,63 @@ def load(transformed_data: dict, table: str, loader: Load) -> int:
     logger.info(f"Loading completed: {successful_loads} success, {failed_loads} failed")
     return 0 if failed_loads == 0 else -1
 
+def drop_existing_records(records: list, table: str, start: int, end: int, 
+                          engine) -> list:
+    zone_ids = sorted({record["zone_id"] for record in records})
+    if not zone_ids:
+        return records
+
+    query = f"""
+        SELECT zone_id, recorded_at
+        FROM {table}
+        WHERE zone_id IN ({','.join(map(str, zone_ids))})
+        AND recorded_at >= to_timestamp({start})
+        AND recorded_at < to_timestamp({end});
+    """
+    try:
+        existing_records = pd.read_sql(query, engine)
+    except Exception as e:
+        logger.critical(f"Failed to retrieve existing records from the database: {e}")
+        return None # type: ignore
+
+    existing_keys = {
+        (int(row["zone_id"]), int(pd.Timestamp(row["recorded_at"]).timestamp()))
+        for _, row in existing_records.iterrows()
+    }
+    new_records = [record for record in records
+                   if (record["zone_id"], record["recorded_at"]) not in existing_keys]
+
+    logger.info(f"Skipping {len(records) - len(new_records)} records already in {table}")
+    return new_records
+
+def backfill(data_coordinates: Dict, extractor: Extract, transformer, loader: Load,
+             app_args, engine) -> int:
+    start, end = app_args.backfill
+    backfiller = Backfill(logger, extractor, transformer, app_args.checkpoint_dir, 
+                          app_args.workers)
+    chunks = backfiller.get_chunks(data_coordinates, start, end, 
+                                   app_args.chunk_days * 24 * 60 * 60)
+
+    if backfiller.fetch(chunks) > 0:
+        logger.info("Some backfill chunks failed, run again with the same arguments to resume.")
+        return -1
+
+    records = backfiller.collect(chunks)
+    records = drop_existing_records(records, app_args.target_table, start, end, engine)
+    if records is None:
+        return -1
+    if records:
+        unified_data = unify_data(records, transformer.columns)
+        successful_loads, failed_loads = loader.load_data(unified_data, app_args.target_table,
+                                                          chunksize = 1000)
+        logger.info(f"Backfill loading completed: {successful_loads} success, "
+                    f"{failed_loads} failed")
+        if failed_loads != 0:
+            return -1
+
+    backfiller.clear_checkpoints(chunks)
+    return 0
+
 def main():
     logger.info("Starting ETL pipeline")
     app_args = get_args(logger)
@@ -266,7 +340,10 @@ def main():
         logger.info("No zone IDs found. Exiting.")
         return
 
-    extractors = get_extractors(app_secrets["required_apis"])
+    # Only the backfill fans out requests in parallel, the live run keeps its pace
+    requests_per_minute = app_args.requests_per_minute if app_args.backfill is not None else 0
+    extractors = get_extractors(app_secrets["required_apis"], requests_per_minute,
+                                app_args.api_host)
     if not extractors:
         logger.info("No extractors available. Exiting.")
         return
@@ -276,6 +353,13 @@ def main():
         return
     loader = Load(logger, engine)
 
+    if app_args.backfill is not None:
+        result = backfill(data_coordinates, extractors["OPEN_WEATHER_AIR_QUALITY"], 
+                          transformer, loader, app_args, engine)
+        if result == -1:
+            logger.info("Backfill failed. Exiting.")
+        return
+
     raw_data = extract(data_coordinates, extractors, app_args.grid_size)
     if not raw_data:
         logger.info("No data extracted. Exiting.")
@@ -72,20 +72,46 @@ class AirQualityTransformer:
         if zone_id == -1:
             return {}
 
-        transformed_data = {
-            "recorded_at": int(record["timestamp"]),
-            "zone_id": zone_id,
-            "co": record["data"]["OPEN_WEATHER_AIR_QUALITY"]["list"][0]["components"].get("co"),
-            "no": record["data"]["OPEN_WEATHER_AIR_QUALITY"]["list"][0]["components"].get("no"),
-            "no2": record["data"]["OPEN_WEATHER_AIR_QUALITY"]["list"][0]["components"].get("no2"),
-            "o3": record["data"]["OPEN_WEATHER_AIR_QUALITY"]["list"][0]["components"].get("o3"),
-            "so2": record["data"]["OPEN_WEATHER_AIR_QUALITY"]["list"][0]["components"].get("so2"),
-            "pm2_5": record["data"]["OPEN_WEATHER_AIR_QUALITY"]["list"][0]["components"].get("pm2_5"),
-            "pm10": record["data"]["OPEN_WEATHER_AIR_QUALITY"]["list"][0]["components"].get("pm10"),
-            "nh3": record["data"]["OPEN_WEATHER_AIR_QUALITY"]["list"][0]["components"].get("nh3"),
-        }
+        components = record["data"]["OPEN_WEATHER_AIR_QUALITY"]["list"][0]["components"]
+        transformed_data = self.build_record(int(record["timestamp"]), zone_id, components)
 
         if not self.validate_data(transformed_data):
             return {}
         
-        return transformed_data
\ No newline at end of file
+        return transformed_data
+
+    def transform_history(self, record: Dict) -> list:
+        if not self.validate_structure(record):
+            return []
+
+        latitude = record["latitude"]
+        longitude = record["longitude"]
+        zone_id = self.get_zone(latitude, longitude)
+        if zone_id == -1:
+            return []
+
+        transformed_data = []
+        for entry in record["data"]["OPEN_WEATHER_AIR_QUALITY"].get("list", []):
+            if "dt" not in entry or "components" not in entry:
+                self.logger.error("Invalid history entry structure.")
+                continue
+            transformed_record = self.build_record(entry["dt"], zone_id, entry["components"])
+            if not self.validate_data(transformed_record):
+                continue
+            transformed_data.append(transformed_record)
+
+        return transformed_data
+
+    def build_record(self, recorded_at: int, zone_id: int, components: Dict) -> Dict:
+        return {
+            "recorded_at": recorded_at,
+            "zone_id": zone_id,
+            "co": components.get("co"),
+            "no": components.get("no"),
+            "no2": components.get("no2"),
+            "o3": components.get("o3"),
+            "so2": components.get("so2"),
+            "pm2_5": components.get("pm2_5"),
+            "pm10": components.get("pm10"),
+            "nh3": components.get("nh3"),
+        }
\ No newline at end of file